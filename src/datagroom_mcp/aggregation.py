@@ -0,0 +1,183 @@
+"""Local aggregation of dataset rows for MCP tool outputs."""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# numpy is optional; when present, ungrouped batches are reduced in C
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NUMERIC_OPERATIONS = ('sum', 'avg', 'min', 'max')
+
+# Rows per batch when feeding streamed rows into RowAggregator.add_rows
+BATCH_ROWS = 1000
+
+# int64 sums are only trusted when they provably cannot overflow
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _reduce_exact(values: List[Any]) -> Tuple[Any, Any, Any]:
+    """Sum, min and max of a non-empty list in a single Python pass."""
+    lo = hi = values[0]
+    total = 0 + lo  # a lone bool sums to an int, as sum() does
+    for value in values[1:]:
+        total += value
+        if value < lo:
+            lo = value
+        elif value > hi:
+            hi = value
+    return total, lo, hi
+
+
+class RowAggregator:
+    """
+    Single-pass aggregator keeping running count/sum/min/max per group.
+    
+    Rows are fed one at a time, so no per-group row lists or per-aggregation
+    value lists are built.
+    
+    Args:
+        aggregations: List of {operation: 'count|sum|avg|min|max', field: 'column_name'}
+        group_by: Optional field to group rows by
+    """
+    
+    def __init__(self, aggregations: List[Dict[str, Any]], group_by: Optional[str] = None):
+        self.aggregations = aggregations
+        self.group_by = group_by
+        self.numeric_fields = tuple(dict.fromkeys(
+            agg.get('field') for agg in aggregations
+            if agg.get('operation') in NUMERIC_OPERATIONS
+        ))
+        self.row_count = 0
+        # group value -> [row count, {field: [count, sum, min, max]}]
+        self._accs: Dict[Any, List[Any]] = {}
+    
+    def add(self, row: Dict[str, Any]) -> None:
+        """Fold one row into the accumulators."""
+        self.row_count += 1
+        
+        group_value = row.get(self.group_by, 'null') if self.group_by else None
+        acc = self._accs.get(group_value)
+        if acc is None:
+            acc = self._accs[group_value] = [0, {}]
+        acc[0] += 1
+        
+        stats = acc[1]
+        for field in self.numeric_fields:
+            value = row.get(field)
+            if not isinstance(value, (int, float)):
+                continue
+            stat = stats.get(field)
+            if stat is None:
+                # 0 + value: a lone bool sums to an int, as sum() does
+                stats[field] = [1, 0 + value, value, value]
+            else:
+                stat[0] += 1
+                stat[1] += value
+                if value < stat[2]:
+                    stat[2] = value
+                if value > stat[3]:
+                    stat[3] = value
+    
+    def add_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """
+        Fold an iterable of rows into the accumulators.
+        
+        Without grouping and with numpy installed, each numeric field of the
+        batch is reduced as one array instead of value by value.
+        """
+        if np is None or self.group_by:
+            for row in rows:
+                self.add(row)
+            return
+        
+        rows = rows if isinstance(rows, list) else list(rows)
+        if not rows:
+            return
+        
+        self.row_count += len(rows)
+        acc = self._accs.get(None)
+        if acc is None:
+            acc = self._accs[None] = [0, {}]
+        acc[0] += len(rows)
+        
+        stats = acc[1]
+        for field in self.numeric_fields:
+            values = [
+                value for row in rows
+                if isinstance(value := row.get(field), (int, float))
+            ]
+            if not values:
+                continue
+            
+            try:
+                arr = np.asarray(values)
+            except OverflowError:
+                arr = None
+            if arr is None or arr.dtype.kind not in 'biuf' or (
+                arr.dtype.kind == 'f' and not any(isinstance(v, float) for v in values)
+            ):
+                # Integers beyond int64 (an object array, or float64 when
+                # mixed with bools or negatives): keep exact Python arithmetic
+                total, lo, hi = _reduce_exact(values)
+            else:
+                # Index back into values so min/max keep their original
+                # type (mixed int/float batches are upcast to float64)
+                lo = values[int(arr.argmin())]
+                hi = values[int(arr.argmax())]
+                if arr.dtype.kind in 'iu' and max(-lo, hi) * len(values) > _INT64_MAX:
+                    total = sum(values)
+                else:
+                    total = arr.sum().item()
+            self._merge(stats, field, len(values), total, lo, hi)
+    
+    @staticmethod
+    def _merge(stats: Dict[str, List[Any]], field: str, n: int, total: Any, lo: Any, hi: Any) -> None:
+        """Merge a batch's count/sum/min/max for field into stats."""
+        stat = stats.get(field)
+        if stat is None:
+            stats[field] = [n, total, lo, hi]
+            return
+        stat[0] += n
+        stat[1] += total
+        if lo < stat[2]:
+            stat[2] = lo
+        if hi > stat[3]:
+            stat[3] = hi
+    
+    def results(self) -> List[Dict[str, Any]]:
+        """
+        Build aggregation results from the accumulators.
+        
+        Returns:
+            One result dict per group (or a single dict when not grouping)
+        """
+        results = []
+        
+        for group_value, (count, stats) in self._accs.items():
+            result: Dict[str, Any] = {'group': group_value} if self.group_by else {}
+            
+            for agg in self.aggregations:
+                operation = agg.get('operation')
+                field = agg.get('field')
+                
+                if operation == 'count':
+                    result['count'] = count
+                elif operation in NUMERIC_OPERATIONS:
+                    stat = stats.get(field)
+                    if stat is None:
+                        continue
+                    n, total, lo, hi = stat
+                    if operation == 'sum':
+                        result[f'sum_{field}'] = total
+                    elif operation == 'avg':
+                        result[f'avg_{field}'] = total / n
+                    elif operation == 'min':
+                        result[f'min_{field}'] = lo
+                    elif operation == 'max':
+                        result[f'max_{field}'] = hi
+            
+            results.append(result)
+        
+        return results
@@ -0,0 +1,76 @@
+"""In-process caching of Gateway-backed tool results."""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SWRCache:
+    """
+    TTL cache with stale-while-revalidate and LRU eviction.
+    
+    Fresh entries are returned directly. Stale entries are returned as-is
+    while a background task refetches them; misses wait for the fetch.
+    Entries older than ttl + max_stale count as misses, and a failed
+    refresh evicts the entry, so errors such as revoked access surface on
+    the next call instead of being hidden behind the stale value.
+    
+    Args:
+        ttl: Seconds an entry stays fresh
+        maxsize: Maximum number of entries kept (least recently used evicted)
+        max_stale: Seconds past ttl a stale entry may still be served
+    """
+    
+    def __init__(self, ttl: float = 300.0, maxsize: int = 64, max_stale: float = 300.0):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.max_stale = max_stale
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._refreshing: Dict[Hashable, asyncio.Task] = {}
+    
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Get the value for key, calling fetch on a miss or to revalidate.
+        
+        Args:
+            key: Cache key
+            fetch: Zero-argument coroutine function producing the value
+            
+        Returns:
+            Cached or freshly fetched value
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry[0]
+            if age > self.ttl + self.max_stale:
+                entry = None
+        
+        if entry is None:
+            value = await fetch()
+            self._store(key, value)
+            return value
+        
+        self._entries.move_to_end(key)
+        if age > self.ttl and key not in self._refreshing:
+            self._refreshing[key] = asyncio.create_task(self._refresh(key, fetch))
+        return entry[1]
+    
+    async def _refresh(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> None:
+        """Refetch a stale entry; on failure evict it so the next call refetches."""
+        try:
+            self._store(key, await fetch())
+        except Exception as e:
+            logger.warning("Background refresh failed for %r, evicting: %s", key, e)
+            self._entries.pop(key, None)
+        finally:
+            self._refreshing.pop(key, None)
+    
+    def _store(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
@@ -3,7 +3,7 @@
 import json
 import os
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 
 # PAT and gateway URL are read from mcp.json (~/.cursor/mcp.json), not from .env
 
@@ -11,32 +11,51 @@ from typing import Any, Optional
 _MCP_JSON_PATH = Path(os.path.expanduser("~")) / ".cursor" / "mcp.json"
 _MCP_SERVER_KEY = "datagroom"  # key under mcpServers in mcp.json
 
+# Last parsed env from mcp.json, keyed by (st_mtime_ns, st_size) of the file
+_MCP_JSON_CACHE: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+
 
 def _load_env_from_mcp_json() -> dict[str, Any]:
     """
     Read DATAGROOM_* env from Cursor's mcp.json.
     Expects: mcpServers["datagroom"]["env"] with DATAGROOM_PAT_TOKEN, DATAGROOM_GATEWAY_URL.
+    The parsed result is cached until the file's mtime or size changes.
     """
-    if not _MCP_JSON_PATH.exists():
+    global _MCP_JSON_CACHE
+
+    try:
+        st = _MCP_JSON_PATH.stat()
+    except OSError:
         return {}
+
+    key = (st.st_mtime_ns, st.st_size)
+    if _MCP_JSON_CACHE is not None and _MCP_JSON_CACHE[0] == key:
+        return _MCP_JSON_CACHE[1]
+
+    env: Dict[str, Any] = {}
     try:
         text = _MCP_JSON_PATH.read_text(encoding="utf-8")
         data = json.loads(text)
         servers = data.get("mcpServers") or {}
         server = servers.get(_MCP_SERVER_KEY)
-        if not server or not isinstance(server, dict):
-            return {}
-        env = server.get("env")
-        if not env or not isinstance(env, dict):
-            return {}
-        return env
-    except (OSError, json.JSONDecodeError, TypeError):
+        if server and isinstance(server, dict):
+            server_env = server.get("env")
+            if server_env and isinstance(server_env, dict):
+                env = server_env
+    except (OSError, json.JSONDecodeError, TypeError, AttributeError):
         return {}
 
+    _MCP_JSON_CACHE = (key, env)
+    return env
+
 
 class Config:
     """Configuration: env vars override; otherwise read from ~/.cursor/mcp.json."""
 
+    GATEWAY_URL: str = "http://localhost:8887"
+    PAT_TOKEN: Optional[str] = None
+    MAX_RESPONSE_BYTES: int = 200 * 1024 * 1024  # 200 MB
+
     _validated = False
 
     @classmethod
@@ -44,6 +63,9 @@ class Config:
         """Load config: env vars first, then mcp.json (mcpServers.datagroom.env)."""
         cls.GATEWAY_URL = os.getenv("DATAGROOM_GATEWAY_URL") or "http://localhost:8887"
         cls.PAT_TOKEN = os.getenv("DATAGROOM_PAT_TOKEN")
+        cls.MAX_RESPONSE_BYTES = int(
+            os.getenv("DATAGROOM_MAX_RESPONSE_BYTES") or 200 * 1024 * 1024
+        )
 
         # If PAT not in environment, read from mcp.json (primary source for MCP)
         if not cls.PAT_TOKEN:
@@ -81,7 +103,3 @@ class Config:
         if not cls._validated:
             cls.validate()
         return f"{cls.GATEWAY_URL}{endpoint}"
-
-
-# Initialize config values (will be reloaded on validate())
-Config._reload()
@@ -1,5 +1,6 @@
 """Response formatting utilities for MCP tool outputs."""
 
+import sys
 from typing import Any, Dict, List
 
 
@@ -18,40 +19,44 @@ def format_markdown_table(data: List[Dict[str, Any]], max_rows: int = 50) -> str
         return "No data to display."
     
     # Limit rows for readability
+    total_rows = len(data)
     display_data = data[:max_rows]
-    truncated = len(data) > max_rows
-    
-    # Get columns from first row
-    columns = list(display_data[0].keys())
-    
-    # Filter out _id column if present
-    columns = [col for col in columns if col != '_id']
-    
-    # Build table
-    lines = []
+    truncated = total_rows > max_rows
+    
+    # Get columns from first row, filtering out _id column if present.
+    # Interned names make the per-cell dict lookups cheaper.
+    columns = tuple(sys.intern(col) for col in display_data[0] if col != '_id')
+    
+    def _cell(row: Dict[str, Any], col: str) -> Any:
+        # Columns are usually present, so index directly
+        try:
+            value = row[col]
+        except KeyError:
+            return ""
+        # Handle complex types (exact type check: rows are decoded JSON)
+        if value.__class__ in (dict, list):
+            return str(value)[:50]  # Truncate complex values
+        return value
+    
+    # Row template built once: "| {} | {} | ... |"
+    row_fmt = "| " + " | ".join(["{}"] * len(columns)) + " |"
     
     # Header
-    header = "| " + " | ".join(columns) + " |"
-    separator = "| " + " | ".join(["---" for _ in columns]) + " |"
-    lines.append(header)
-    lines.append(separator)
+    lines = [
+        "| " + " | ".join(columns) + " |",
+        "| " + " | ".join(["---"] * len(columns)) + " |",
+    ]
     
     # Rows
-    for row in display_data:
-        values = []
-        for col in columns:
-            value = row.get(col, "")
-            # Handle complex types
-            if isinstance(value, (dict, list)):
-                value = str(value)[:50]  # Truncate complex values
-            values.append(str(value))
-        
-        lines.append("| " + " | ".join(values) + " |")
+    lines.extend(
+        row_fmt.format(*[_cell(row, col) for col in columns])
+        for row in display_data
+    )
     
     # Add truncation notice
     if truncated:
         lines.append("")
-        lines.append(f"_(Showing first {max_rows} of {len(data)} rows)_")
+        lines.append(f"_(Showing first {max_rows} of {total_rows} rows)_")
     
     return "\n".join(lines)
 
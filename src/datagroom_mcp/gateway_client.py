@@ -1,28 +1,115 @@
 """HTTP client for Datagroom Gateway API requests."""
 
+import asyncio
 import httpx
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 import logging
 
 from .config import Config
 
+# orjson is an optional speedup for (de)serializing large row payloads
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    import json as _json
+    _loads = _json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return _json.dumps(obj).encode("utf-8")
+
+# ijson is optional; without it streamed responses are buffered and parsed whole
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
 
+class ResponseTooLargeError(httpx.HTTPError):
+    """Gateway response body exceeds Config.MAX_RESPONSE_BYTES."""
+
+
 class GatewayClient:
     """Async HTTP client for Datagroom Gateway with PAT authentication."""
     
     def __init__(self):
-        self.base_url = Config.GATEWAY_URL
-        self.pat_token = Config.PAT_TOKEN
         self.timeout = httpx.Timeout(60.0)  # 60 second timeout
+        # Shared client is created lazily on first request: there may be no
+        # running event loop yet when this module is imported.
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_lock = asyncio.Lock()
+        # PAT and content type never change once config is validated
+        self._headers: Optional[Dict[str, str]] = None
         
     def _get_headers(self) -> Dict[str, str]:
-        """Get headers with PAT authentication."""
-        return {
-            "Authorization": f"Bearer {self.pat_token}",
-            "Content-Type": "application/json",
-        }
+        """Get headers with PAT authentication, built once after validation."""
+        if self._headers is None:
+            Config.validate()
+            self._headers = {
+                "Authorization": f"Bearer {Config.PAT_TOKEN}",
+                "Content-Type": "application/json",
+            }
+        return self._headers
+    
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared AsyncClient, creating it on first use."""
+        if self._client is not None:
+            return self._client
+        
+        async with self._client_lock:
+            if self._client is None:
+                headers = self._get_headers()
+                self._client = httpx.AsyncClient(
+                    base_url=Config.GATEWAY_URL,
+                    timeout=self.timeout,
+                    headers=headers,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=20,
+                        max_connections=50,
+                        keepalive_expiry=30.0,
+                    ),
+                )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the shared AsyncClient and release pooled connections."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+    
+    async def _iter_bounded(self, response: httpx.Response) -> AsyncIterator[bytes]:
+        """
+        Yield decoded body chunks, enforcing Config.MAX_RESPONSE_BYTES.
+        
+        The declared Content-Length is checked before reading; the decoded
+        (decompressed) size is checked as chunks arrive.
+        
+        Raises:
+            ResponseTooLargeError: If the body exceeds the limit
+        """
+        limit = Config.MAX_RESPONSE_BYTES
+        declared = response.headers.get("content-length", "")
+        if declared.isdigit() and int(declared) > limit:
+            raise ResponseTooLargeError(
+                f"Gateway response of {declared} bytes exceeds limit of {limit} bytes"
+            )
+        
+        size = 0
+        async for chunk in response.aiter_bytes():
+            size += len(chunk)
+            if size > limit:
+                raise ResponseTooLargeError(
+                    f"Gateway response exceeds limit of {limit} bytes"
+                )
+            yield chunk
+    
+    async def _read_json(self, response: httpx.Response) -> Any:
+        """Read a size-bounded response body and parse it as JSON."""
+        body = b"".join([chunk async for chunk in self._iter_bounded(response)])
+        return _loads(body)
     
     async def get(self, endpoint: str) -> Dict[str, Any]:
         """
@@ -35,16 +122,15 @@ class GatewayClient:
             JSON response as dictionary
             
         Raises:
-            httpx.HTTPError: If request fails
+            httpx.HTTPError: If request fails or the body exceeds
+                Config.MAX_RESPONSE_BYTES (ResponseTooLargeError)
         """
-        url = Config.get_gateway_url(endpoint)
-        
-        logger.info(f"GET {url}")
-        
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(url, headers=self._get_headers())
+        client = await self._get_client()
+        # URL parts go to the logger so nothing is formatted when INFO is off
+        logger.info("GET %s%s", Config.GATEWAY_URL, endpoint)
+        async with client.stream("GET", endpoint) as response:
             response.raise_for_status()
-            return response.json()
+            return await self._read_json(response)
     
     async def post(
         self, 
@@ -64,21 +150,80 @@ class GatewayClient:
             JSON response as dictionary
             
         Raises:
-            httpx.HTTPError: If request fails
+            httpx.HTTPError: If request fails or the body exceeds
+                Config.MAX_RESPONSE_BYTES (ResponseTooLargeError)
+        """
+        client = await self._get_client()
+        logger.info("POST %s%s", Config.GATEWAY_URL, endpoint)
+        # Content-Type: application/json is set on the shared client
+        content = _dumps(json) if json is not None else None
+        async with client.stream("POST", endpoint, content=content, params=params) as response:
+            response.raise_for_status()
+            return await self._read_json(response)
+    
+    async def stream_post_items(
+        self,
+        endpoint: str,
+        json: Optional[Dict[str, Any]] = None,
+        item_path: str = "data.item",
+        meta: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Any]:
         """
-        url = Config.get_gateway_url(endpoint)
+        Make POST request to Gateway and yield JSON items as they arrive.
         
-        logger.info(f"POST {url}")
+        Items under item_path are parsed incrementally from the socket, so
+        memory stays proportional to one item rather than the whole body.
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.post(
-                url, 
-                headers=self._get_headers(),
-                json=json,
-                params=params
-            )
+        Args:
+            endpoint: API endpoint
+            json: JSON body
+            item_path: ijson prefix of the items to yield (e.g., "data.item")
+            meta: Optional dict whose keys name top-level response fields
+                (e.g., {"total": None}); filled in once the body has been read
+            
+        Yields:
+            Parsed items, one at a time
+            
+        Raises:
+            httpx.HTTPError: If request fails or the body exceeds
+                Config.MAX_RESPONSE_BYTES (ResponseTooLargeError)
+        """
+        client = await self._get_client()
+        logger.info("POST %s%s (streaming)", Config.GATEWAY_URL, endpoint)
+        content = _dumps(json) if json is not None else None
+        async with client.stream("POST", endpoint, content=content) as response:
             response.raise_for_status()
-            return response.json()
+            
+            if ijson is None:
+                data = await self._read_json(response)
+                for key in meta or ():
+                    meta[key] = data.get(key)
+                for key in item_path.split(".")[:-1]:
+                    data = data.get(key) or {}
+                for item in data or []:
+                    yield item
+                return
+            
+            # use_float keeps numbers as float (not Decimal) like json.loads
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, item_path, use_float=True)
+            fields = {key: ijson.sendable_list() for key in meta or ()}
+            parsers = [parser] + [
+                ijson.items_coro(values, key, use_float=True)
+                for key, values in fields.items()
+            ]
+            async for chunk in self._iter_bounded(response):
+                for coro in parsers:
+                    coro.send(chunk)
+                for item in items:
+                    yield item
+                del items[:]
+            for coro in parsers:
+                coro.close()
+            for item in items:
+                yield item
+            for key, values in fields.items():
+                meta[key] = values[0] if values else None
 
 
 # Global client instance
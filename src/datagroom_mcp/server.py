@@ -1,11 +1,22 @@
 """Datagroom MCP Server - Main server implementation with all tools."""
 
+import asyncio
+import inspect
 import logging
-from typing import Any, Dict, List, Optional
+import math
+import os
+import time
+from contextlib import asynccontextmanager
+from operator import itemgetter
+from typing import Annotated, Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
 
+import anyio
+import httpx
 from mcp.server.fastmcp import FastMCP
 from pydantic import Field
 
+from .aggregation import BATCH_ROWS, RowAggregator
+from .cache import SWRCache
 from .config import Config
 from .gateway_client import gateway_client
 from .formatters import (
@@ -22,75 +33,202 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Number of MCP sessions currently running (FastMCP enters the lifespan per session)
+_active_sessions = 0
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close pooled Gateway connections on the server's loop once the last session ends."""
+    global _active_sessions
+    _active_sessions += 1
+    try:
+        yield
+    finally:
+        _active_sessions -= 1
+        if not _active_sessions:
+            # Shielded so the close still runs when shutdown cancels the session
+            with anyio.CancelScope(shield=True):
+                await gateway_client.aclose()
+
+
 # Initialize FastMCP server
-mcp = FastMCP("datagroom-mcp-server")
+mcp = FastMCP("datagroom-mcp-server", lifespan=_lifespan)
+
+# Schemas and dataset lists change rarely: serve them from an in-process
+# cache for 5 minutes, then revalidate in the background
+_schema_cache = SWRCache(ttl=300.0, maxsize=64)
+_dataset_list_cache = SWRCache(ttl=300.0, maxsize=64)
+
+# Optional Gateway routes that answered with Express's default 404, mapped to
+# the monotonic time after which they are probed again (the Gateway may be
+# upgraded while this server keeps running)
+MISSING_ROUTE_TTL = 600.0
+_missing_routes: Dict[str, float] = {}
+
+
+def _route_missing(route: str) -> bool:
+    """Whether route was recently found missing on the Gateway."""
+    return time.monotonic() < _missing_routes.get(route, 0.0)
+
+
+def _note_missing_route(route: str, error: httpx.HTTPStatusError) -> bool:
+    """
+    Remember route as missing if error says the Gateway has no such route.
+    
+    Express answers unknown routes with an HTML "Cannot POST" page, while the
+    Gateway's own 404s (unknown dataset or view) are JSON, so only a non-JSON
+    404 marks the route missing.
+    
+    Returns:
+        True if the route was marked missing, False for any other error
+    """
+    response = error.response
+    if response.status_code != 404 or "json" in response.headers.get("content-type", ""):
+        return False
+    _missing_routes[route] = time.monotonic() + MISSING_ROUTE_TTL
+    return True
+
+
+# ============================================================================
+# Tool Registration
+# ============================================================================
+
+# Which tools get their full schema registered at startup:
+#   full    - every tool (default)
+#   minimal - discovery tools only (list datasets, get schema)
+#   none    - no tools
+# Anything not warmed up stays reachable through datagroom_call_tool and is
+# registered with the server the first time it is called.
+TOOL_WARMUP = os.getenv("DATAGROOM_TOOL_WARMUP", "full").strip().lower()
+_MINIMAL_TOOLS = ("datagroom_list_datasets", "datagroom_get_schema")
+
+# Tool functions by name, collected by @_tool and registered on demand
+_TOOL_FUNCS: Dict[str, Callable[..., Awaitable[str]]] = {}
+_registered_tools: set = set()
+
+# Compact index of every tool: {name: {"description": ..., "params_summary": ...}}
+TOOL_METADATA: Dict[str, Dict[str, str]] = {}
+
+
+def _tool(fn: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+    """Collect a tool function and its metadata without registering it."""
+    name = fn.__name__
+    _TOOL_FUNCS[name] = fn
+    TOOL_METADATA[name] = {
+        "description": (inspect.getdoc(fn) or "").split("\n", 1)[0],
+        "params_summary": ", ".join(inspect.signature(fn).parameters),
+    }
+    return fn
+
+
+def register_tool(name: str) -> None:
+    """Register a tool's full schema with the MCP server (idempotent)."""
+    if name in _registered_tools:
+        return
+    mcp.tool()(_TOOL_FUNCS[name])
+    _registered_tools.add(name)
 
 
 # ============================================================================
 # TOOL 1: Get Dataset Schema
 # ============================================================================
 
-@mcp.tool()
+# Set once the columns endpoint is seen to return 'total' itself; the
+# separate row-count query is skipped from then on
+_columns_report_total = False
+
+
+async def _fetch_schema(dataset_name: str, view_name: str, user_name: str) -> str:
+    """Fetch and format a dataset schema from the Gateway."""
+    global _columns_report_total
+    
+    # Call Gateway API - note the /ds/ prefix
+    endpoint = f"/ds/view/columns/{dataset_name}/{view_name}/{user_name}"
+    
+    if _columns_report_total:
+        response = await gateway_client.get(endpoint)
+        count_response = response
+    else:
+        # Get row count by querying with limit 1, concurrently with the columns
+        query_endpoint = f"/ds/viewViaPost/{dataset_name}/{view_name}/{user_name}"
+        response, count_response = await asyncio.gather(
+            gateway_client.get(endpoint),
+            gateway_client.post(
+                query_endpoint,
+                json={"filters": [], "page": 1, "per_page": 1}
+            )
+        )
+        if 'total' in response:
+            _columns_report_total = True
+    
+    # Extract schema information
+    columns = response.get('columns', {})
+    column_attrs = response.get('columnAttrs', [])
+    keys = response.get('keys', [])
+    filters = response.get('filters', {})
+    
+    total_rows = count_response.get('total', 0)
+    
+    # Format schema data - columns is a dict like {'1': 'col1', '2': 'col2'}
+    column_list = []
+    if isinstance(columns, dict):
+        # Index columnAttrs by field once (first match wins, as before)
+        attrs_by_field: Dict[Any, Dict[str, Any]] = {}
+        for attr in column_attrs:
+            attrs_by_field.setdefault(attr.get('field'), attr)
+        
+        # Parse each column index once; non-numeric indices sort as 0
+        indexed = []
+        for idx, col_name in columns.items():
+            try:
+                indexed.append((int(idx), col_name))
+            except (TypeError, ValueError):
+                indexed.append((0, col_name))
+        indexed.sort(key=itemgetter(0))
+        
+        # Extract column names in index order
+        for _, col_name in indexed:
+            col_attr = attrs_by_field.get(col_name, {})
+            column_list.append({
+                'name': col_name,
+                'type': col_attr.get('editor', 'string'),
+                'width': col_attr.get('width', 150),
+                'sample_values': []
+            })
+    
+    schema_data = {
+        'dataset_name': dataset_name,
+        'columns': column_list,
+        'total_rows': total_rows,
+        'keys': keys
+    }
+    
+    return format_schema_info(schema_data)
+
+
+@_tool
 async def datagroom_get_schema(
     dataset_name: str,
-    view_name: str = Field(
-        default="default",
+    view_name: Annotated[str, Field(
         description="View name (defaults to 'default')"
-    ),
-    user_name: str = Field(
-        default="mcp-user",
+    )] = "default",
+    user_name: Annotated[str, Field(
         description="User name for access control (defaults to 'mcp-user')"
-    )
+    )] = "mcp-user"
 ) -> str:
     """
     Get schema information for a dataset including column names, types, and sample values.
     Use this first when working with a new dataset to understand its structure.
     """
     try:
-        # Call Gateway API - note the /ds/ prefix
-        endpoint = f"/ds/view/columns/{dataset_name}/{view_name}/{user_name}"
-        response = await gateway_client.get(endpoint)
-        
-        # Extract schema information
-        columns = response.get('columns', {})
-        column_attrs = response.get('columnAttrs', [])
-        keys = response.get('keys', [])
-        filters = response.get('filters', {})
-        
-        # Get row count by querying with limit 1
-        query_endpoint = f"/ds/viewViaPost/{dataset_name}/{view_name}/{user_name}"
-        count_response = await gateway_client.post(
-            query_endpoint,
-            json={"filters": [], "page": 1, "per_page": 1}
+        return await _schema_cache.get(
+            (dataset_name, view_name, user_name),
+            lambda: _fetch_schema(dataset_name, view_name, user_name)
         )
-        total_rows = count_response.get('total', 0)
-        
-        # Format schema data - columns is a dict like {'1': 'col1', '2': 'col2'}
-        column_list = []
-        if isinstance(columns, dict):
-            # Extract column names from the columns dict
-            for idx in sorted(columns.keys(), key=lambda x: int(x) if x.isdigit() else 0):
-                col_name = columns[idx]
-                # Find matching columnAttr
-                col_attr = next((attr for attr in column_attrs if attr.get('field') == col_name), {})
-                column_list.append({
-                    'name': col_name,
-                    'type': col_attr.get('editor', 'string'),
-                    'width': col_attr.get('width', 150),
-                    'sample_values': []
-                })
-        
-        schema_data = {
-            'dataset_name': dataset_name,
-            'columns': column_list,
-            'total_rows': total_rows,
-            'keys': keys
-        }
-        
-        return format_schema_info(schema_data)
         
     except Exception as e:
-        logger.error(f"Error getting schema for {dataset_name}: {e}")
+        logger.exception("Error getting schema for %s", dataset_name)
         return f"Error: Failed to get schema for dataset '{dataset_name}'. {str(e)}"
 
 
@@ -98,44 +236,47 @@ async def datagroom_get_schema(
 # TOOL 2: Query Dataset
 # ============================================================================
 
-@mcp.tool()
+@_tool
 async def datagroom_query_dataset(
     dataset_name: str,
-    filters: List[Dict[str, Any]] = Field(
-        default=[],
+    filters: Annotated[Optional[List[Dict[str, Any]]], Field(
         description="Array of filter objects with structure: [{field: 'column_name', type: 'eq|ne|gt|lt|gte|lte|in|regex', value: filter_value}]"
-    ),
-    sort_field: Optional[str] = Field(
-        default=None,
+    )] = None,
+    sort_field: Annotated[Optional[str], Field(
         description="Field to sort by"
-    ),
-    sort_direction: str = Field(
-        default="asc",
+    )] = None,
+    sort_direction: Annotated[str, Field(
         description="Sort direction: 'asc' or 'desc'"
-    ),
-    max_rows: int = Field(
-        default=100,
+    )] = "asc",
+    max_rows: Annotated[int, Field(
         description="Maximum rows to return (max: 1000)",
         le=1000
-    ),
-    offset: int = Field(
-        default=0,
+    )] = 100,
+    offset: Annotated[int, Field(
         description="Number of rows to skip for pagination"
-    ),
-    view_name: str = Field(
-        default="default",
+    )] = 0,
+    view_name: Annotated[str, Field(
         description="View name (defaults to 'default')"
-    ),
-    user_name: str = Field(
-        default="mcp-user",
+    )] = "default",
+    user_name: Annotated[str, Field(
         description="User name for access control (defaults to 'mcp-user')"
-    )
+    )] = "mcp-user"
 ) -> str:
     """
     Query a dataset with filters and return matching rows.
     Respects all ACLs (dataset-level and row-level permissions).
     """
     try:
+        filters = filters or []
+        
+        # The Gateway pages in blocks of per_page, so only page-aligned
+        # offsets map to an exact slice of rows
+        if offset % max_rows:
+            return (
+                f"Error: offset ({offset}) must be a multiple of max_rows ({max_rows}). "
+                f"Use offset {offset - offset % max_rows} or set max_rows to a divisor of the offset."
+            )
+        
         # Prepare query payload
         page = (offset // max_rows) + 1
         
@@ -163,7 +304,7 @@ async def datagroom_query_dataset(
         # Check if results exceed limit
         warning = ""
         if total > max_rows:
-            warning = f"\n\n⚠️ **Warning**: {total} rows match your filters, but only returning first {max_rows}. Use offset parameter or refine filters.\n"
+            warning = f"\n\n⚠️ **Warning**: {total} rows match your filters, but only returning first {max_rows}. Use offset parameter (a multiple of max_rows) or refine filters.\n"
         
         # Format response
         summary = format_query_summary(
@@ -179,7 +320,7 @@ async def datagroom_query_dataset(
         return f"{summary}\n\n{table}{warning}"
         
     except Exception as e:
-        logger.error(f"Error querying dataset {dataset_name}: {e}")
+        logger.exception("Error querying dataset %s", dataset_name)
         return f"Error: Failed to query dataset '{dataset_name}'. {str(e)}"
 
 
@@ -187,117 +328,111 @@ async def datagroom_query_dataset(
 # TOOL 3: Aggregate Dataset
 # ============================================================================
 
-@mcp.tool()
+# Rows fetched per Gateway page when aggregating locally
+AGGREGATION_PAGE_SIZE = 2000
+
+
+@_tool
 async def datagroom_aggregate_dataset(
     dataset_name: str,
-    aggregations: List[Dict[str, Any]] = Field(
+    aggregations: Annotated[List[Dict[str, Any]], Field(
         description="List of aggregations: [{operation: 'count|sum|avg|min|max', field: 'column_name'}]"
-    ),
-    group_by: Optional[str] = Field(
-        default=None,
+    )],
+    group_by: Annotated[Optional[str], Field(
         description="Field to group results by"
-    ),
-    filters: List[Dict[str, Any]] = Field(
-        default=[],
+    )] = None,
+    filters: Annotated[Optional[List[Dict[str, Any]]], Field(
         description="Optional filters to apply before aggregation"
-    ),
-    view_name: str = Field(
-        default="default",
+    )] = None,
+    view_name: Annotated[str, Field(
         description="View name (defaults to 'default')"
-    ),
-    user_name: str = Field(
-        default="mcp-user",
+    )] = "default",
+    user_name: Annotated[str, Field(
         description="User name for access control (defaults to 'mcp-user')"
-    )
+    )] = "mcp-user"
 ) -> str:
     """
     Perform aggregations on a dataset (count, sum, avg, min, max).
     Returns statistical summaries without fetching all rows.
     """
     try:
-        # Note: This requires MongoDB aggregation pipeline support in Gateway
-        # For now, we'll fetch data and compute locally
-        # TODO: Add aggregation endpoint to Gateway for better performance
-        
-        # Fetch data with filters - use /ds/ prefix
+        filters = filters or []
+        
+        # Let the Gateway run the aggregation as a MongoDB pipeline, unless
+        # a recent call found the endpoint missing
+        if not _route_missing("aggregateViaPost"):
+            aggregate_endpoint = f"/ds/aggregateViaPost/{dataset_name}/{view_name}/{user_name}"
+            try:
+                response = await gateway_client.post(
+                    aggregate_endpoint,
+                    json={
+                        "aggregations": aggregations,
+                        "group_by": group_by,
+                        "filters": filters
+                    }
+                )
+            except httpx.HTTPStatusError as e:
+                # Older Gateways lack the endpoint; fall back to local aggregation
+                if not _note_missing_route("aggregateViaPost", e):
+                    raise
+                logger.info("Gateway has no aggregation endpoint, aggregating locally")
+            else:
+                results = response.get('results', [])
+                if not results:
+                    return f"No data found in dataset '{dataset_name}' with the given filters."
+                return format_aggregation_results(results)
+        
+        # Page through matching rows with filters, stream-parsing each page
+        # and aggregating rows while the rest of the page is still arriving -
+        # use /ds/ prefix. The first page's total fixes the number of pages.
         endpoint = f"/ds/viewViaPost/{dataset_name}/{view_name}/{user_name}"
-        response = await gateway_client.post(
-            endpoint,
-            json={"filters": filters, "page": 1, "per_page": 10000}
-        )
-        
-        data = response.get('data', [])
-        
-        if not data:
-            return f"No data found in dataset '{dataset_name}' with the given filters."
-        
-        # Compute aggregations locally
-        results = []
-        
-        if group_by:
-            # Group by field
-            groups: Dict[Any, List[Dict]] = {}
-            for row in data:
-                group_value = row.get(group_by, 'null')
-                if group_value not in groups:
-                    groups[group_value] = []
-                groups[group_value].append(row)
-            
-            # Compute aggregations for each group
-            for group_value, group_rows in groups.items():
-                result = {'group': group_value}
-                
-                for agg in aggregations:
-                    operation = agg.get('operation')
-                    field = agg.get('field')
-                    
-                    if operation == 'count':
-                        result['count'] = len(group_rows)
-                    elif operation in ['sum', 'avg', 'min', 'max']:
-                        values = [row.get(field) for row in group_rows if field in row]
-                        values = [v for v in values if isinstance(v, (int, float))]
-                        
-                        if values:
-                            if operation == 'sum':
-                                result[f'sum_{field}'] = sum(values)
-                            elif operation == 'avg':
-                                result[f'avg_{field}'] = sum(values) / len(values)
-                            elif operation == 'min':
-                                result[f'min_{field}'] = min(values)
-                            elif operation == 'max':
-                                result[f'max_{field}'] = max(values)
-                
-                results.append(result)
-        else:
-            # Aggregate across all rows
-            result = {}
+        aggregator = RowAggregator(aggregations, group_by)
+        per_page = AGGREGATION_PAGE_SIZE
+        last_page = None
+        page = 1
+        while True:
+            meta = {"total": None}
+            page_rows = 0
+            batch = []
+            async for row in gateway_client.stream_post_items(
+                endpoint,
+                json={"filters": filters, "page": page, "per_page": per_page},
+                meta=meta
+            ):
+                page_rows += 1
+                batch.append(row)
+                if len(batch) >= BATCH_ROWS:
+                    aggregator.add_rows(batch)
+                    batch = []
+            aggregator.add_rows(batch)
             
-            for agg in aggregations:
-                operation = agg.get('operation')
-                field = agg.get('field')
-                
-                if operation == 'count':
-                    result['count'] = len(data)
-                elif operation in ['sum', 'avg', 'min', 'max']:
-                    values = [row.get(field) for row in data if field in row]
-                    values = [v for v in values if isinstance(v, (int, float))]
-                    
-                    if values:
-                        if operation == 'sum':
-                            result[f'sum_{field}'] = sum(values)
-                        elif operation == 'avg':
-                            result[f'avg_{field}'] = sum(values) / len(values)
-                        elif operation == 'min':
-                            result[f'min_{field}'] = min(values)
-                        elif operation == 'max':
-                            result[f'max_{field}'] = max(values)
+            total = meta["total"]
+            if page == 1 and page_rows and isinstance(total, int):
+                if page_rows < min(per_page, total):
+                    # The Gateway caps page size below per_page: page by its size
+                    per_page = page_rows
+                    logger.info("Gateway caps pages at %d rows", per_page)
+                # Hard cap, so a Gateway that ignores page cannot loop forever
+                last_page = math.ceil(total / per_page)
             
-            results.append(result)
+            if last_page is not None:
+                done = page >= last_page
+            else:
+                # No total to page against: a short page is the last one
+                done = page_rows < per_page
+            if done or not page_rows:
+                break
+            page += 1
+        
+        if not aggregator.row_count:
+            return f"No data found in dataset '{dataset_name}' with the given filters."
+        
+        results = aggregator.results()
         
         return format_aggregation_results(results)
         
     except Exception as e:
-        logger.error(f"Error aggregating dataset {dataset_name}: {e}")
+        logger.exception("Error aggregating dataset %s", dataset_name)
         return f"Error: Failed to aggregate dataset '{dataset_name}'. {str(e)}"
 
 
@@ -305,42 +440,49 @@ async def datagroom_aggregate_dataset(
 # TOOL 4: List Datasets
 # ============================================================================
 
-@mcp.tool()
+async def _fetch_dataset_list(user_name: str) -> str:
+    """Fetch and format the datasets visible to user_name."""
+    # Call Gateway endpoint - /ds/dsList/:dsUser
+    endpoint = f"/ds/dsList/{user_name}"
+    response = await gateway_client.get(endpoint)
+    datasets = response.get('dbList', [])
+    
+    if not datasets:
+        return "No datasets found. You may not have access to any datasets."
+    
+    lines = ["# Available Datasets", ""]
+    
+    for ds in datasets:
+        if isinstance(ds, dict):
+            name = ds.get('name', 'unknown')
+            size_mb = ds.get('sizeOnDisk', 0) / (1024 * 1024)  # Convert to MB
+            perms = ds.get('perms', {})
+            owner = perms.get('owner', 'unknown')
+            lines.append(f"- **{name}** (Size: {size_mb:.2f} MB, Owner: {owner})")
+        elif isinstance(ds, str):
+            lines.append(f"- {ds}")
+    
+    return "\n".join(lines)
+
+
+@_tool
 async def datagroom_list_datasets(
-    user_name: str = Field(
-        default="mcp-user",
+    user_name: Annotated[str, Field(
         description="User name for access control (defaults to 'mcp-user')"
-    )
+    )] = "mcp-user"
 ) -> str:
     """
     List all available datasets in Datagroom.
     Use this to discover which datasets you have access to.
     """
     try:
-        # Call Gateway endpoint - /ds/dsList/:dsUser
-        endpoint = f"/ds/dsList/{user_name}"
-        response = await gateway_client.get(endpoint)
-        datasets = response.get('dbList', [])
-        
-        if not datasets:
-            return "No datasets found. You may not have access to any datasets."
-        
-        lines = ["# Available Datasets", ""]
-        
-        for ds in datasets:
-            if isinstance(ds, dict):
-                name = ds.get('name', 'unknown')
-                size_mb = ds.get('sizeOnDisk', 0) / (1024 * 1024)  # Convert to MB
-                perms = ds.get('perms', {})
-                owner = perms.get('owner', 'unknown')
-                lines.append(f"- **{name}** (Size: {size_mb:.2f} MB, Owner: {owner})")
-            elif isinstance(ds, str):
-                lines.append(f"- {ds}")
-        
-        return "\n".join(lines)
+        return await _dataset_list_cache.get(
+            user_name,
+            lambda: _fetch_dataset_list(user_name)
+        )
         
     except Exception as e:
-        logger.error(f"Error listing datasets: {e}")
+        logger.exception("Error listing datasets")
         return f"Error: Failed to list datasets. {str(e)}"
 
 
@@ -348,35 +490,49 @@ async def datagroom_list_datasets(
 # TOOL 5: Sample Dataset
 # ============================================================================
 
-@mcp.tool()
+@_tool
 async def datagroom_sample_dataset(
     dataset_name: str,
-    sample_size: int = Field(
-        default=20,
+    sample_size: Annotated[int, Field(
         description="Number of random rows to sample (max: 100)",
         le=100
-    ),
-    view_name: str = Field(
-        default="default",
+    )] = 20,
+    view_name: Annotated[str, Field(
         description="View name (defaults to 'default')"
-    ),
-    user_name: str = Field(
-        default="mcp-user",
+    )] = "default",
+    user_name: Annotated[str, Field(
         description="User name for access control (defaults to 'mcp-user')"
-    )
+    )] = "mcp-user"
 ) -> str:
     """
     Get a random sample of rows from a dataset.
     Useful for exploring data without knowing the structure.
     """
     try:
-        # Fetch random sample by querying first N rows - use /ds/ prefix
-        # Note: MongoDB $sample would be better but requires aggregation pipeline
-        endpoint = f"/ds/viewViaPost/{dataset_name}/{view_name}/{user_name}"
-        response = await gateway_client.post(
-            endpoint,
-            json={"filters": [], "page": 1, "per_page": sample_size}
-        )
+        # Gateway draws the sample with a MongoDB $match + $sample pipeline,
+        # unless a recent call found the endpoint missing
+        response = None
+        note = ""
+        if not _route_missing("sampleViaPost"):
+            endpoint = f"/ds/sampleViaPost/{dataset_name}/{view_name}/{user_name}"
+            try:
+                response = await gateway_client.post(
+                    endpoint,
+                    json={"filters": [], "size": sample_size}
+                )
+            except httpx.HTTPStatusError as e:
+                # Older Gateways lack the endpoint; fall back to the first N rows
+                if not _note_missing_route("sampleViaPost", e):
+                    raise
+                logger.info("Gateway has no sampling endpoint, returning first rows")
+        
+        if response is None:
+            endpoint = f"/ds/viewViaPost/{dataset_name}/{view_name}/{user_name}"
+            response = await gateway_client.post(
+                endpoint,
+                json={"filters": [], "page": 1, "per_page": sample_size}
+            )
+            note = "_(Gateway does not support sampling; showing the first rows)_\n\n"
         
         data = response.get('data', [])
         total = response.get('total', 0)
@@ -387,16 +543,71 @@ async def datagroom_sample_dataset(
         summary = f"# Sample from {dataset_name}\n\n"
         summary += f"**Total rows in dataset**: {total}\n"
         summary += f"**Sample size**: {len(data)}\n\n"
+        summary += note
         
         table = format_markdown_table(data, max_rows=sample_size)
         
         return summary + table
         
     except Exception as e:
-        logger.error(f"Error sampling dataset {dataset_name}: {e}")
+        logger.exception("Error sampling dataset %s", dataset_name)
         return f"Error: Failed to sample dataset '{dataset_name}'. {str(e)}"
 
 
+# ============================================================================
+# Lazy Tool Dispatch
+# ============================================================================
+
+async def datagroom_call_tool(
+    tool_name: str,
+    arguments: Annotated[Optional[Dict[str, Any]], Field(
+        description="Arguments for the tool, keyed by parameter name"
+    )] = None
+) -> str:
+    """
+    Call a Datagroom tool by name.
+    Registers the tool's full schema on first use, then runs it.
+    """
+    if tool_name not in _TOOL_FUNCS:
+        available = ", ".join(TOOL_METADATA)
+        return f"Error: Unknown tool '{tool_name}'. Available tools: {available}"
+    
+    register_tool(tool_name)
+    # Tool.run returns the raw tool result; mcp is pinned <2 for this API
+    tool = mcp._tool_manager.get_tool(tool_name)
+    return await tool.run(arguments or {})
+
+
+def _call_tool_description() -> str:
+    """Describe datagroom_call_tool with the compact index of all tools."""
+    lines = [inspect.getdoc(datagroom_call_tool) or "", "", "Available tools:"]
+    for name, meta in TOOL_METADATA.items():
+        lines.append(f"- {name}({meta['params_summary']}): {meta['description']}")
+    return "\n".join(lines)
+
+
+def register_tools(warmup: str = TOOL_WARMUP) -> None:
+    """Register tools according to the warmup level (full, minimal or none)."""
+    if warmup == "minimal":
+        names = _MINIMAL_TOOLS
+    elif warmup == "none":
+        names = ()
+    else:
+        if warmup != "full":
+            logger.warning("Unknown DATAGROOM_TOOL_WARMUP=%r, using 'full'", warmup)
+        names = tuple(_TOOL_FUNCS)
+    
+    for name in names:
+        register_tool(name)
+    
+    # Expose the dispatcher whenever some tools are not registered up front
+    if len(names) < len(_TOOL_FUNCS):
+        mcp.tool(description=_call_tool_description())(datagroom_call_tool)
+
+
+register_tools()
+
+
 # ============================================================================
 # Main Entry Point
 # ============================================================================
@@ -407,7 +618,7 @@ def main():
     Config.validate()
     
     logger.info("Starting Datagroom MCP Server...")
-    logger.info(f"Gateway URL: {Config.GATEWAY_URL}")
+    logger.info("Gateway URL: %s", Config.GATEWAY_URL)
     
     # Run the FastMCP server with streamable-http transport
     # Note: mcp.server.fastmcp doesn't support custom port configuration
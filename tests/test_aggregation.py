@@ -0,0 +1,160 @@
+"""Tests for RowAggregator against the original list-based aggregation."""
+
+import math
+import random
+
+import pytest
+
+from datagroom_mcp import aggregation
+from datagroom_mcp.aggregation import RowAggregator
+
+AGGREGATIONS = [
+    {'operation': 'count', 'field': 'x'},
+    {'operation': 'sum', 'field': 'x'},
+    {'operation': 'avg', 'field': 'x'},
+    {'operation': 'min', 'field': 'x'},
+    {'operation': 'max', 'field': 'x'},
+    {'operation': 'sum', 'field': 'y'},
+    {'operation': 'min', 'field': 'y'},
+]
+
+
+def reference_aggregate(data, aggregations, group_by=None):
+    """Aggregation as the server computed it before RowAggregator."""
+    if group_by:
+        groups = {}
+        for row in data:
+            groups.setdefault(row.get(group_by, 'null'), []).append(row)
+        items = list(groups.items())
+    else:
+        items = [(None, data)]
+
+    results = []
+    for group_value, rows in items:
+        result = {'group': group_value} if group_by else {}
+        for agg in aggregations:
+            operation = agg.get('operation')
+            field = agg.get('field')
+            if operation == 'count':
+                result['count'] = len(rows)
+            elif operation in ['sum', 'avg', 'min', 'max']:
+                values = [row.get(field) for row in rows if field in row]
+                values = [v for v in values if isinstance(v, (int, float))]
+                if values:
+                    if operation == 'sum':
+                        result[f'sum_{field}'] = sum(values)
+                    elif operation == 'avg':
+                        result[f'avg_{field}'] = sum(values) / len(values)
+                    elif operation == 'min':
+                        result[f'min_{field}'] = min(values)
+                    elif operation == 'max':
+                        result[f'max_{field}'] = max(values)
+        results.append(result)
+    return results
+
+
+def assert_same_results(actual, expected):
+    """Compare results by value and type; float sums may differ in rounding."""
+    assert len(actual) == len(expected)
+    for got, want in zip(actual, expected):
+        assert got.keys() == want.keys()
+        for key, value in want.items():
+            assert type(got[key]) is type(value), key
+            if isinstance(value, float):
+                assert got[key] == pytest.approx(value, rel=1e-12), key
+            else:
+                assert got[key] == value, key
+
+
+def aggregate_rows(rows, group_by=None, batch_size=None):
+    """Run RowAggregator row by row, or through add_rows in batches."""
+    aggregator = RowAggregator(AGGREGATIONS, group_by)
+    if batch_size is None:
+        for row in rows:
+            aggregator.add(row)
+    else:
+        for start in range(0, len(rows), batch_size):
+            aggregator.add_rows(rows[start:start + batch_size])
+    return aggregator.results()
+
+
+@pytest.fixture(params=['numpy', 'pure'])
+def numpy_mode(request, monkeypatch):
+    """Run each test with numpy (when installed) and without it."""
+    if request.param == 'numpy':
+        if aggregation.np is None:
+            pytest.skip("numpy is not installed")
+    else:
+        monkeypatch.setattr(aggregation, 'np', None)
+    return request.param
+
+
+CASES = {
+    'ints': [{'x': 3, 'g': 'a'}, {'x': -7, 'g': 'b'}, {'x': 12, 'g': 'a'}],
+    'floats': [{'x': 1.5}, {'x': -0.25}, {'x': 2.125}],
+    'mixed_int_float': [{'x': 1, 'g': 1}, {'x': 2.5, 'g': 1}, {'x': 1.0, 'g': 2}, {'x': -3}],
+    'bools': [{'x': True, 'g': 'a'}, {'x': False, 'g': 'a'}, {'x': True, 'g': 'b'}],
+    'lone_bool': [{'x': True}],
+    'bools_and_ints': [{'x': True}, {'x': 5}, {'x': False}, {'x': -2}],
+    'missing_and_non_numeric': [
+        {'x': 'text', 'y': 1}, {'y': None}, {'x': None}, {}, {'x': [1]},
+        {'x': 4, 'y': '2'}, {'x': 1.5},
+    ],
+    'no_numeric_values': [{'x': 'a'}, {'y': None}],
+    'huge_ints': [{'x': 2 ** 63 + 5}, {'x': 2 ** 70}, {'x': -1}],
+    'int64_overflow': [{'x': 2 ** 62}, {'x': 2 ** 62}, {'x': 2 ** 62}],
+    'bool_with_uint64': [{'x': False}, {'x': 2}, {'x': 2 ** 63 + 5}],
+    'float_with_uint64': [{'x': 0.5}, {'x': 2 ** 63 + 5}],
+}
+
+
+@pytest.mark.parametrize('group_by', [None, 'g'])
+@pytest.mark.parametrize('batch_size', [None, 1, 2, 1000])
+@pytest.mark.parametrize('case', sorted(CASES))
+def test_matches_reference(numpy_mode, case, batch_size, group_by):
+    rows = CASES[case]
+    expected = reference_aggregate(rows, AGGREGATIONS, group_by)
+    assert_same_results(aggregate_rows(rows, group_by, batch_size), expected)
+
+
+def test_bool_with_uint64_sum_is_exact(numpy_mode):
+    # numpy upcasts this batch to float64, which would round the sum
+    aggregator = RowAggregator([{'operation': 'sum', 'field': 'x'}])
+    aggregator.add_rows([{'x': False}, {'x': 2}, {'x': 2 ** 63 + 5}])
+    assert aggregator.results() == [{'sum_x': 2 ** 63 + 7}]
+
+
+@pytest.mark.parametrize('group_by', [None, 'g'])
+def test_random_rows_match_reference(numpy_mode, group_by):
+    rng = random.Random(0)
+    choices = [
+        lambda: rng.randint(-1000, 1000),
+        lambda: rng.uniform(-1e6, 1e6),
+        lambda: rng.random() < 0.5,
+        lambda: None,
+        lambda: 'n/a',
+    ]
+    rows = []
+    for _ in range(5000):
+        row = {'g': rng.choice('abc')}
+        for field in ('x', 'y'):
+            if rng.random() < 0.9:
+                row[field] = rng.choice(choices)()
+        rows.append(row)
+
+    expected = reference_aggregate(rows, AGGREGATIONS, group_by)
+    assert_same_results(aggregate_rows(rows, group_by, batch_size=700), expected)
+
+
+def test_row_count_and_empty_batches(numpy_mode):
+    aggregator = RowAggregator(AGGREGATIONS)
+    aggregator.add_rows([])
+    assert aggregator.row_count == 0
+    assert aggregator.results() == []
+
+    aggregator.add_rows(iter([{'x': 1}, {'x': 2}]))
+    aggregator.add({'x': 3})
+    assert aggregator.row_count == 3
+    result, = aggregator.results()
+    assert result['count'] == 3
+    assert math.isclose(result['avg_x'], 2.0)